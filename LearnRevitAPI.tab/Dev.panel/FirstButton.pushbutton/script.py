@@ -50,8 +50,9 @@ app   = __revit__.Application
 #1️⃣ Select Views
 
 sel_el_id = uidoc.Selection.GetElementIds()
-sel_elem = [doc.GetElement(e_id) for e_id in sel_el_id]
-sel_view = [el for el in sel_elem if issubclass(type(el), View)]
+sel_view  = []
+if sel_el_id.Count:  # FilteredElementCollector raises on an empty id collection
+    sel_view = list(FilteredElementCollector(doc, sel_el_id).OfClass(View).ToElements())
 
 # If None Selcted - Promp SelectViews from pyrevit.forms.select_views()
 if not sel_view:
@@ -85,25 +86,102 @@ replace     = user_inputs['replace']
 suffix      = user_inputs['suffix']
 
 
-t = Transaction(doc, 'py-Rename Views')
+#3️⃣ Create new View Names (Ensure unique view name)
+# View names are unique per ViewType, Sheet names may repeat.
+existing_names = {(v.ViewType, v.Name) for v in FilteredElementCollector(doc).OfClass(View)
+                  if not isinstance(v, ViewSheet)}
 
-t.Start()
+# Revit rejects these characters in View names
+invalid_chars = set('\\:{}[]|;<>?`~')
+
+# Empty Find would insert Replace between every character
+do_replace = bool(find)
 
+targets = []
 for view in sel_view:
-    # 3️⃣ Create new View Name
     old_name = view.Name
-    new_name = prefix + old_name.replace(find, replace) + suffix
+    mid      = old_name.replace(find, replace) if do_replace else old_name
+    new_name = ''.join((prefix, mid, suffix))
+    if not new_name:
+        print('Skipped {}: new name is empty'.format(old_name))
+        continue
+    if invalid_chars.intersection(new_name):
+        print('Skipped {}: "{}" contains prohibited characters'.format(old_name, new_name))
+        continue
+    targets.append((view, old_name, new_name))
+
+# Names of renamed views are freed up by the rename itself (skipped Views keep theirs)
+existing_names.difference_update((view.ViewType, old_name) for view, old_name, new_name in targets)
+
+# Views keeping their name reserve it first so other views can't take it
+for view, old_name, new_name in targets:
+    if new_name == old_name and not isinstance(view, ViewSheet):
+        existing_names.add((view.ViewType, new_name))
+
+renames = []
+for view, old_name, new_name in targets:
+    candidate = new_name
+    if new_name != old_name and not isinstance(view, ViewSheet):
+        suffix_count = 0
+        while (view.ViewType, candidate) in existing_names:
+            suffix_count += 1
+            candidate = new_name + '*' * suffix_count
+        existing_names.add((view.ViewType, candidate))
+    renames.append((view, old_name, candidate))
+
+# Target name still held by another selected view -> rename in two phases
+old_keys  = {(view.ViewType, old_name) for view, old_name, new_name in renames
+             if not isinstance(view, ViewSheet)}
+two_phase = any((view.ViewType, new_name) in old_keys and new_name != old_name
+                for view, old_name, new_name in renames)
+
+tmp_names = []
+if two_phase:
+    i = 0
+    for view, old_name, new_name in renames:
+        if isinstance(view, ViewSheet):
+            continue
+        tmp_name = '__tmp_%d' % i
+        while (view.ViewType, tmp_name) in existing_names or (view.ViewType, tmp_name) in old_keys:
+            i += 1
+            tmp_name = '__tmp_%d' % i
+        i += 1
+        tmp_names.append((view, tmp_name))
+
+log    = []
+failed = []
 
-    #4️⃣ Rename Views (Ensure unique view name)
-    for i in range(20):
-        try:
-            view.Name = new_name
-            print('{} -> {}'.format(old_name, new_name))
-            break
-        except:
-            new_name += '*'
+t = Transaction(doc, 'py-Rename Views')
 
-t.Commit()
+t.Start()
+
+#4️⃣ Rename Views (a bad View is skipped, the others are still renamed)
+try:
+    for view, tmp_name in tmp_names:
+        view.Name = tmp_name
+
+    for view, old_name, new_name in renames:
+        try:
+            if view.Name != new_name:
+                view.Name = new_name
+            log.append((old_name, new_name))
+        except Exception as e:
+            failed.append((old_name, str(e)))
+            try:
+                view.Name = old_name  # Undo temporary name from two-phase rename
+            except:
+                pass
+
+    t.Commit()
+except Exception as e:
+    t.RollBack()
+    forms.alert('Renaming failed, no Views were renamed.\n{}'.format(e), exitscript=True)
+
+# Print after Commit to keep I/O out of the Transaction
+if log:
+    print('\n'.join('%s -> %s' % pair for pair in log))
+if failed:
+    print('\n'.join('Failed to rename %s: %s' % pair for pair in failed))
 
 print('-'*50)
 print('Done')
@@ -35,6 +35,12 @@ uidoc = __revit__.ActiveUIDocument
 # SNI PARAMETERS
 SNI_COVER = 0.040  # 40mm cover
 
+# Commit every N elements to keep the undo/regen queue small
+CHUNK = 50
+
+# All bars of an element are grouped in one RebarContainer of this type
+REBAR_CONTAINER_TYPE = "SNI Rebar Container"
+
 
 # ╔╦╗╔═╗╦╔╗╔
 # ║║║╠═╣║║║║
@@ -51,10 +57,12 @@ def get_valid_elements():
             continue
 
         # Check if element can host rebar
-        if isinstance(element, (FamilyInstance, Wall, Floor)):
-            if hasattr(element, 'WallType') and element.WallType.Kind != WallKind.Basic:
+        if isinstance(element, Wall):
+            if element.WallType.Kind != WallKind.Basic:
                 continue
-            valid_elements.append(element)
+        elif not isinstance(element, (FamilyInstance, Floor)):
+            continue
+        valid_elements.append(element)
 
     if not valid_elements:
         forms.alert("No valid structural elements selected!", exitscript=True)
@@ -82,62 +90,59 @@ def get_rebar_counts():
         forms.alert("Invalid input! Use format '3' or '3 5'", exitscript=True)
 
 
-def place_rebars(element, rebar_type, vertical, horizontal):
-    """Place rebars in element with specified quantities"""
-    try:
-        bbox = element.get_BoundingBox(None)
-        if not bbox:
-            print("Skipping {0} - no bounding box".format(element.Id))
-            return False
-
-        # Calculate spacing
-        width = bbox.Max.X - bbox.Min.X
-        height = bbox.Max.Z - bbox.Min.Z
-
-        # Vertical rebars (along height)
-        v_spacing = (width - 2 * SNI_COVER) / max(1, (vertical - 1)) if vertical > 1 else 0
-
-        # Horizontal rebars (along width)
-        h_spacing = (height - 2 * SNI_COVER) / max(1, (horizontal - 1)) if horizontal > 1 else 0
-
-        # Create rebars
-        with Transaction(doc, "Place Rebars") as t:
-            t.Start()
-
-            # Vertical rebars
-            for i in range(vertical):
-                x = bbox.Min.X + SNI_COVER + i * v_spacing
-                line = Line.CreateBound(
-                    XYZ(x, bbox.Min.Y + SNI_COVER, bbox.Min.Z + SNI_COVER),
-                    XYZ(x, bbox.Min.Y + SNI_COVER, bbox.Max.Z - SNI_COVER)
-                )
-                Rebar.CreateFromCurves(
-                    doc, RebarStyle.Standard, rebar_type,
-                    None, None, element, XYZ.BasisX, [line],
-                    RebarHookOrientation.Right, RebarHookOrientation.Right,
-                    True, True
-                )
-
-            # Horizontal rebars
-            for i in range(horizontal):
-                z = bbox.Min.Z + SNI_COVER + i * h_spacing
-                line = Line.CreateBound(
-                    XYZ(bbox.Min.X + SNI_COVER, bbox.Min.Y + SNI_COVER, z),
-                    XYZ(bbox.Max.X - SNI_COVER, bbox.Min.Y + SNI_COVER, z)
-                )
-                Rebar.CreateFromCurves(
-                    doc, RebarStyle.Standard, rebar_type,
-                    None, None, element, XYZ.BasisZ, [line],
-                    RebarHookOrientation.Right, RebarHookOrientation.Right,
-                    True, True
-                )
-
-            t.Commit()
-        return True
-
-    except Exception as e:
-        print("Failed on {0}: {1}".format(element.Id, str(e)))
-        return False
+def plan_rebars(element, vertical, horizontal):
+    """Compute (normal, line) tuples for rebars in element.
+    Does not modify the document."""
+    bbox = element.get_BoundingBox(None)
+    if not bbox:
+        print("Skipping {0} - no bounding box".format(element.Id))
+        return []
+
+    # Cache bounding box values and basis vectors
+    minx, miny, minz = bbox.Min.X, bbox.Min.Y, bbox.Min.Z
+    maxx, maxz = bbox.Max.X, bbox.Max.Z
+    x0, x1 = minx + SNI_COVER, maxx - SNI_COVER
+    y0 = miny + SNI_COVER
+    z0, z1 = minz + SNI_COVER, maxz - SNI_COVER
+    basisX = XYZ.BasisX
+    basisZ = XYZ.BasisZ
+
+    # Calculate spacing
+    width = maxx - minx
+    height = maxz - minz
+
+    # Vertical rebars (along height)
+    v_spacing = (width - 2 * SNI_COVER) / max(1, (vertical - 1)) if vertical > 1 else 0
+
+    # Horizontal rebars (along width)
+    h_spacing = (height - 2 * SNI_COVER) / max(1, (horizontal - 1)) if horizontal > 1 else 0
+
+    # Precompute rebar end points
+    v_xs = [x0 + i * v_spacing for i in range(vertical)]
+    v_starts = [XYZ(x, y0, z0) for x in v_xs]
+    v_ends = [XYZ(x, y0, z1) for x in v_xs]
+
+    h_zs = [z0 + i * h_spacing for i in range(horizontal)]
+    h_starts = [XYZ(x0, y0, z) for z in h_zs]
+    h_ends = [XYZ(x1, y0, z) for z in h_zs]
+
+    plan = [(basisX, Line.CreateBound(s, e)) for s, e in zip(v_starts, v_ends)]
+    plan.extend((basisZ, Line.CreateBound(s, e)) for s, e in zip(h_starts, h_ends))
+    return plan
+
+
+def flush_rebars(element, bars, rebar_type, container_type_id):
+    """Create planned rebars of element as a single RebarContainer.
+    Must be called inside an open Transaction."""
+    # One container element per host, one item per bar
+    container = RebarContainer.Create(doc, element, container_type_id)
+    for normal, line in bars:
+        container.AppendItemFromCurves(
+            RebarStyle.Standard, rebar_type,
+            None, None, normal, [line],
+            RebarHookOrientation.Right, RebarHookOrientation.Right,
+            True, True
+        )
 
 
 # Main execution
@@ -146,39 +151,71 @@ if __name__ == '__main__':
     elements = get_valid_elements()
 
     # 2. Select rebar type
-    rebar_types = FilteredElementCollector(doc).OfClass(RebarBarType).ToElements()
-    rebar_type_names = []
-    for rt in rebar_types:
-        param = rt.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM)
-        rebar_type_names.append(param.AsString() if param else "Unknown")
+    rebar_types = FilteredElementCollector(doc).OfClass(RebarBarType)
+    rebar_type_by_name = {Element.Name.GetValue(rt): rt for rt in rebar_types}
 
     rebar_type_name = forms.SelectFromList.show(
-        rebar_type_names,
+        sorted(rebar_type_by_name.keys()),
         title="Select Rebar Type",
         button_name='Select'
     )
     if not rebar_type_name:
         forms.alert("No rebar type selected!", exitscript=True)
 
-    selected_type = None
-    for i, name in enumerate(rebar_type_names):
-        if name == rebar_type_name:
-            selected_type = rebar_types[i]
-            break
-
+    selected_type = rebar_type_by_name.get(rebar_type_name)
     if not selected_type:
         forms.alert("Failed to find selected rebar type!", exitscript=True)
 
     # 3. Get rebar counts
     vertical, horizontal = get_rebar_counts()
 
-    # 4. Execute placement
-    success_count = 0
+    # 4. Plan rebars (no document changes)
+    plans = []
     for element in elements:
-        if place_rebars(element, selected_type, vertical, horizontal):
-            success_count += 1
+        try:
+            bars = plan_rebars(element, vertical, horizontal)
+        except Exception as e:
+            print("Failed on {0}: {1}".format(element.Id, str(e)))
+            continue
+        if bars:
+            plans.append((element, bars))
 
-    # 5. Show results
+    # 5. Execute placement
+    success_count = 0
+    container_type_id = None
+    for start in range(0, len(plans), CHUNK):
+        t = Transaction(doc, "Place Rebars batch")
+        t.Start()
+        try:
+            # Fetch/create once, it is reused by the following chunks
+            if container_type_id is None:
+                container_type_id = RebarContainerType.GetOrCreateRebarContainerType(
+                    doc, REBAR_CONTAINER_TYPE
+                )
+            chunk_count = 0
+            for element, bars in plans[start:start + CHUNK]:
+                st = SubTransaction(doc)
+                st.Start()
+                try:
+                    flush_rebars(element, bars, selected_type, container_type_id)
+                    st.Commit()
+                    chunk_count += 1
+                except Exception as e:
+                    st.RollBack()
+                    print("Failed on {0}: {1}".format(element.Id, str(e)))
+
+            # Revit failure handling may still roll the whole chunk back
+            if t.Commit() == TransactionStatus.Committed:
+                success_count += chunk_count
+            else:
+                container_type_id = None  # A newly created type was rolled back too
+        except Exception as e:
+            if t.HasStarted() and not t.HasEnded():
+                t.RollBack()
+            container_type_id = None
+            print("Failed on batch {0}: {1}".format(start // CHUNK + 1, str(e)))
+
+    # 6. Show results
     forms.alert(
         "Successfully placed rebar in {0}/{1} elements\n"
         "Vertical: {2} bars\n"